@@ -1,7 +1,9 @@
 import pygame
 import numpy as np
+import pandas as pd
 import os
 import random
+import functools
 
 # --- CONFIG ---
 DATA_FILE = os.path.join('data', 'forest_area.csv') 
@@ -15,33 +17,40 @@ BACKGROUND_IMG_FILE = os.path.join('assets', 'dirt.png')
 CURSOR_IMG_FILE = os.path.join('assets', 'cursor.png')
 SOUND_FILE = os.path.join('assets', 'button-click.mp3')
 SCREEN_SIZE = (1600, 800) 
+TREE_SIZE = (128, 128)  # All tree sprites are drawn at this size
+COLORKEY = (255, 0, 255)  # Magenta, unused by the sprites, marks transparent pixels
 TREE_VISUAL_RANGE = (2, 10)  # Min/max number of trees to visualize per year
 
 # --- DATA LOADING ---
 def load_plantation_data(filepath):
-    # Expects CSV with columns: year, amount
-    years = []
-    areas = []
+    # Expects CSV with columns: Year, Forest_Area_sqkm
+    years = np.array([], dtype=np.int64)
+    areas = np.array([], dtype=np.int64)
     try:
-        with open(filepath, 'r') as f:
-            header = f.readline().strip().split(',')
-            year_idx = header.index('Year')
-            area_idx = header.index('Forest_Area_sqkm')
-            prev_area = None
-            for line in f:
-                if line.strip():
-                    parts = line.strip().split(',')
-                    year = int(parts[year_idx])
-                    area = int(parts[area_idx])
-                    years.append(year)
-                    areas.append(area)
+        df = pd.read_csv(filepath, usecols=['Year', 'Forest_Area_sqkm'],
+                         dtype={'Year': np.int64, 'Forest_Area_sqkm': np.int64})
+        years = df['Year'].to_numpy()
+        areas = df['Forest_Area_sqkm'].to_numpy()
     except Exception as e:
         print(f"Error loading data: {e}")
     return years, areas
 
 # --- TREE IMAGE LOADING ---
+def load_keyed_image(filepath, size=None):
+    # The sprites are either fully opaque or fully transparent per pixel, so an opaque
+    # surface with a colorkey looks the same and blits faster than per-pixel alpha
+    img = pygame.image.load(filepath).convert_alpha()
+    if size is not None and img.get_size() != size:
+        # Nearest-neighbour scaling keeps the alpha strictly on/off for the colorkey
+        img = pygame.transform.scale(img, size)
+    keyed = pygame.Surface(img.get_size()).convert()
+    keyed.fill(COLORKEY)
+    keyed.blit(img, (0, 0))
+    keyed.set_colorkey(COLORKEY, pygame.RLEACCEL)
+    return keyed
+
 def load_tree_images(img_files):
-    return [pygame.image.load(f).convert_alpha() for f in img_files]
+    return [load_keyed_image(f, TREE_SIZE) for f in img_files]
 
 # --- MAPPING FUNCTION ---
 def map_tree_amount(amount, min_amount, max_amount, visual_min, visual_max):
@@ -51,6 +60,27 @@ def map_tree_amount(amount, min_amount, max_amount, visual_min, visual_max):
     mapped = int(np.interp(amount, [min_amount, max_amount], [visual_min, visual_max]))
     return mapped
 
+# --- BACKGROUND PRE-RENDERING ---
+def compute_tile_positions(tile_size, size):
+    # Positions of the rhombus tiles in a brick pattern covering a surface of the given size
+    bg_width, bg_height = tile_size
+    overlap_x = int(bg_width * 0.15)  # Horizontal overlap
+    overlap_y = int(bg_height * 0.75)  # Vertical overlap (adjust as needed)
+    y_offset = -80  # Move tiles up by 40 pixels
+    positions = []
+    for y in range(y_offset, size[1], bg_height - overlap_y):
+        offset_x = (bg_width // 2) if ((y-y_offset) // (bg_height - overlap_y)) % 2 else 0
+        positions.extend((x, y) for x in range(-offset_x, size[0], bg_width - overlap_x))
+    return positions
+
+def build_background(background_img, size):
+    # Tile the background image once, onto an opaque surface
+    bg_cache = pygame.Surface(size).convert()
+    bg_cache.fill((255, 255, 255))
+    tile_positions = compute_tile_positions(background_img.get_size(), size)
+    bg_cache.blits([(background_img, pos) for pos in tile_positions], doreturn=False)
+    return bg_cache
+
 # --- MAIN PROGRAM ---
 def main():
     pygame.init()
@@ -64,13 +94,35 @@ def main():
     scale_factor = 1.2  # You can adjust this value for more/less enlargement
     bg_width, bg_height = raw_bg_img.get_width(), raw_bg_img.get_height()
     background_img = pygame.transform.smoothscale(raw_bg_img, (int(bg_width*scale_factor), int(bg_height*scale_factor)))
-    cursor_img = pygame.image.load(CURSOR_IMG_FILE).convert_alpha()
+    bg_cache = build_background(background_img, SCREEN_SIZE)
+    cursor_img = load_keyed_image(CURSOR_IMG_FILE)
     sound = pygame.mixer.Sound(SOUND_FILE)
 
     # Load data
     years, areas = load_plantation_data(DATA_FILE)
     year_idx = 0
-    trees = []
+    # Trees grouped by sprite: id(img) -> [(img, pos), ...], ready to pass to a batch blit as-is
+    trees = {}
+    # pygame-ce's fblits() skips the per-blit return values; fall back to blits() otherwise
+    blit_batch = screen.fblits if hasattr(screen, 'fblits') else (lambda seq: screen.blits(seq, doreturn=False))
+
+    # Fonts and static text, built once: font construction and rasterization are costly
+    FONTS = {
+        80: pygame.font.SysFont('VCR OSD Mono', 80, bold=True),
+        40: pygame.font.SysFont('VCR OSD Mono', 40),
+        36: pygame.font.SysFont('VCR OSD Mono', 36, bold=True),
+        32: pygame.font.SysFont('VCR OSD Mono', 32, bold=True),
+    }
+    TEXT_CACHE = {
+        'title': FONTS[80].render("Green Growth", True, (0, 120, 0)),
+        'subtitle': FONTS[40].render("China's forestry plantation from 1973 to 2025", True, (0, 80, 0)),
+        'start': FONTS[36].render("Let's start!", True, (255,255,255)),
+        'restart': FONTS[32].render("Restart the program", True, (255,255,255)),
+    }
+
+    @functools.lru_cache(maxsize=max(1, len(years)))
+    def render_year_text(i):
+        return FONTS[36].render(f"Year: {years[i]}  Area: {areas[i]} sqkm", True, (0, 80, 0))
 
     # UI state
     show_start = True
@@ -78,9 +130,15 @@ def main():
 
     running = True
     while running:
-        for event in pygame.event.get():
+        # Nothing animates on its own (only clicks and the cursor change the frame), so sleep until an event arrives
+        events = [pygame.event.wait()]
+        events.extend(pygame.event.get())
+        for event in events:
             if event.type == pygame.QUIT:
                 running = False
+            elif event.type == pygame.VIDEORESIZE:
+                # Tile positions depend on the window size, so rebuild the cached background
+                bg_cache = build_background(background_img, event.size)
             elif event.type == pygame.MOUSEBUTTONDOWN:
                 if show_start:
                     show_start = False
@@ -91,7 +149,7 @@ def main():
                     if btn_x <= event.pos[0] <= btn_x+btn_w and btn_y <= event.pos[1] <= btn_y+btn_h:
                         # Restart program
                         year_idx = 0
-                        trees = []
+                        trees = {}
                         show_start = True
                         show_end = False
                 elif year_idx < len(years):
@@ -110,30 +168,20 @@ def main():
                             random.randint(0, SCREEN_SIZE[0] - tree_w),
                             random.randint(0, SCREEN_SIZE[1] - tree_h)
                         )
-                        trees.append((tree_img, pos))
+                        trees.setdefault(id(tree_img), []).append((tree_img, pos))
+                    # One click sound per year, however many trees were planted
+                    if tree_count > 0:
                         sound.play()
                     year_idx += 1
 
-        # Fill background with white
-        screen.fill((255, 255, 255))
-        # Tile the rhombus background image in a brick pattern
-        bg_width, bg_height = background_img.get_width(), background_img.get_height()
-        overlap_x = int(bg_width * 0.15)  # Horizontal overlap
-        overlap_y = int(bg_height * 0.75)  # Vertical overlap (adjust as needed)
-        y_offset = -80  # Move tiles up by 40 pixels
-        for y in range(y_offset, SCREEN_SIZE[1], bg_height - overlap_y):
-            offset_x = (bg_width // 2) if ((y-y_offset) // (bg_height - overlap_y)) % 2 else 0
-            for x in range(-offset_x, SCREEN_SIZE[0], bg_width - overlap_x):
-                screen.blit(background_img, (x, y))
+        # Draw the pre-rendered white + brick-tiled background in a single blit
+        screen.blit(bg_cache, (0, 0))
 
         if show_start:
             # Draw title, subtitle, and start button
-            title_font = pygame.font.SysFont('VCR OSD Mono', 80, bold=True)
-            subtitle_font = pygame.font.SysFont('VCR OSD Mono', 40)
-            btn_font = pygame.font.SysFont('VCR OSD Mono', 36, bold=True)
-            title = title_font.render("Green Growth", True, (0, 120, 0))
-            subtitle = subtitle_font.render("China's forestry plantation from 1973 to 2025", True, (0, 80, 0))
-            btn_text = btn_font.render("Let's start!", True, (255,255,255))
+            title = TEXT_CACHE['title']
+            subtitle = TEXT_CACHE['subtitle']
+            btn_text = TEXT_CACHE['start']
             # Vertically center title, subtitle, and button
             spacing = 40
             total_height = title.get_height() + spacing + subtitle.get_height() + spacing + 80
@@ -148,20 +196,18 @@ def main():
             screen.blit(btn_text, (btn_x+(btn_w-btn_text.get_width())//2, btn_y+(btn_h-btn_text.get_height())//2))
         else:
             # Draw trees (accumulated)
-            for sprite, pos in trees:
-                screen.blit(sprite, pos)
+            for blit_sequence in trees.values():
+                blit_batch(blit_sequence)
             # Draw custom cursor and bottom text (refresh every frame)
             mx, my = pygame.mouse.get_pos()
             screen.blit(cursor_img, (mx-16, my-16))
             if year_idx > 0 and year_idx <= len(years):
-                pixel_font = pygame.font.SysFont('VCR OSD Mono', 36, bold=True)
-                text = pixel_font.render(f"Year: {years[year_idx-1]}  Area: {areas[year_idx-1]} sqkm", True, (0, 80, 0))
+                text = render_year_text(year_idx-1)
                 screen.blit(text, (20, SCREEN_SIZE[1]-40))
             # Show restart button if at last year
             if year_idx == len(years):
                 show_end = True
-                btn_font = pygame.font.SysFont('VCR OSD Mono', 32, bold=True)
-                btn_text = btn_font.render("Restart the program", True, (255,255,255))
+                btn_text = TEXT_CACHE['restart']
                 btn_w, btn_h = btn_text.get_width() + 60, btn_text.get_height() + 30
                 btn_x, btn_y = SCREEN_SIZE[0]-btn_w-40, SCREEN_SIZE[1]-btn_h-40
                 pygame.draw.rect(screen, (0,120,0), (btn_x, btn_y, btn_w, btn_h), border_radius=20)
@@ -7,6 +7,7 @@ Echo Journal - A Pygame GUI for real-time transcription and visualization.
 Required Packages & Libraries:
     pip install faster-whisper[gpu] sounddevice numpy torch
     python -m textblob.download_corpora
+    pip install numba  (optional, compiles the text layout loop)
 
 This application captures audio from the microphone, transcribes it in real-time using
 Faster-Whisper, and displays the text in a Pygame window. As more text is generated,
@@ -20,15 +21,27 @@ import queue
 import threading
 import time
 import pygame
+import pygame.freetype as ft
 import random
+import os
+import json
+import importlib.resources
+import string
+import itertools
 from collections import deque
-from nrclex import NRCLex
+import nrclex
+try:
+    from numba import njit
+except ImportError:
+    # Numba is optional; without it the layout runs as plain Python
+    def njit(*args, **kwargs):
+        return lambda func: func
 
 # --- Configuration ---
 # Models: 'tiny.en', 'base.en', 'small.en', 'medium.en'
 MODEL_SIZE = "base.en"
 DEVICE = "cpu" # Forcing CPU as per user request for stability
-COMPUTE_TYPE = "float32" # CPU requires float32
+COMPUTE_TYPE = "int8" # CTranslate2 quantizes the weights at load time; much faster than float32 on CPU
 
 SAMPLE_RATE = 16000
 CHUNK_SECONDS = 3
@@ -58,48 +71,139 @@ EMOTION_COLORS = {
 }
 DEFAULT_TEXT_COLOR = (0, 0, 0)
 
+def build_word_color_table():
+    """Builds a word -> color lookup from the NRC lexicon shipped with nrclex."""
+    lexicon = getattr(nrclex.NRCLex, "lexicon", None)
+    if lexicon is None:
+        # nrclex 4.1+ no longer keeps the lexicon on the class; it ships as package data
+        lexicon_file = importlib.resources.files("nrclex.data") / "nrc_en.json"
+        lexicon = json.loads(lexicon_file.read_text())
+    # Color each word by its first listed emotion, as NRCLex's affect_dict did
+    return {
+        word: EMOTION_COLORS.get(emotions[0], DEFAULT_TEXT_COLOR)
+        for word, emotions in lexicon.items() if emotions
+    }
+
+WORD_COLOR = build_word_color_table()
+
 # --- Queues for Inter-thread Communication ---
-audio_queue = queue.Queue()
-text_queue = queue.Queue()
+# At most two chunks wait for transcription; the callback drops the oldest when
+# the workers fall behind, so the text on screen never lags further than that.
+audio_queue = queue.Queue(maxsize=2)
+text_queue = queue.Queue() # (sequence number, text) pairs, possibly out of order
+# Transcribe two chunks in parallel when there are cores to spare
+N_WORKERS = 2 if (os.cpu_count() or 1) > 2 else 1
 model_loaded = threading.Event() # Used to signal that the model is ready
+MODEL_READY = pygame.USEREVENT + 1 # Posted to the GUI once model loading has finished
+
+# --- Preallocated Ring Buffer for Audio Chunks ---
+# The callback copies each block into a free row and queues its index; the worker
+# hands the row back once transcribed, so no array is allocated per chunk.
+N_AUDIO_SLOTS = 4 # Enough for a full audio_queue plus one chunk per worker
+audio_ring = np.empty((N_AUDIO_SLOTS, BLOCK_SIZE), dtype=np.float32)
+free_slots = queue.Queue()
+for _slot in range(N_AUDIO_SLOTS):
+    free_slots.put(_slot)
 
 # --- Transcription Worker ---
 def transcription_worker():
-    """A worker thread that transcribes audio and passes text to the GUI."""
+    """A worker thread that loads the model, then transcribes with N_WORKERS threads."""
     print(f"Loading Whisper model '{MODEL_SIZE}' on device '{DEVICE}'...")
     try:
-        model = WhisperModel(MODEL_SIZE, device=DEVICE, compute_type=COMPUTE_TYPE)
+        # num_workers lets concurrent transcribe() calls on the shared model run in parallel
+        model = WhisperModel(MODEL_SIZE, device=DEVICE, compute_type=COMPUTE_TYPE, num_workers=N_WORKERS)
         print("Model loaded. Transcription is active.")
         model_loaded.set() # Signal that the model is ready
+        pygame.event.post(pygame.event.Event(MODEL_READY))
     except Exception as e:
         print(f"Error loading model: {e}")
         model_loaded.set() # Also signal on error to not block the main thread
+        pygame.event.post(pygame.event.Event(MODEL_READY))
         return
 
+    helpers = [threading.Thread(target=transcribe_chunks, args=(model,), daemon=True)
+               for _ in range(N_WORKERS - 1)]
+    for helper in helpers:
+        helper.start()
+    transcribe_chunks(model)
+    for helper in helpers:
+        helper.join()
+
+def transcribe_chunks(model):
+    """Transcribes queued audio chunks and passes their text to the GUI."""
     while True:
+        audio_chunk = audio_queue.get()
+        if audio_chunk is None: # Sentinel value to stop the thread
+            break
+
+        # View into the preallocated ring buffer, no copy or conversion needed
+        seq, slot, frames = audio_chunk
+        audio_np = audio_ring[slot, :frames]
+        transcription = ""
         try:
-            audio_chunk = audio_queue.get()
-            if audio_chunk is None: # Sentinel value to stop the thread
-                break
-            
-            audio_np = np.squeeze(audio_chunk).astype(np.float32)
-            segments, _ = model.transcribe(audio_np, language="en", beam_size=5)
-            
+            segments, _ = model.transcribe(
+                audio_np, language="en",
+                beam_size=1,  # Greedy decoding: several times faster than beam search for short chunks
+                vad_filter=True,  # Skip silent stretches instead of decoding them
+                condition_on_previous_text=False,
+            )
+            # Segments are decoded lazily, so the slot is only free after this join
             transcription = "".join(segment.text for segment in segments).strip()
-            if transcription:
-                text_queue.put(transcription) # Send text to the GUI thread
         except Exception as e:
             print(f"An error occurred during transcription: {e}")
             break
+        finally:
+            free_slots.put(slot)
+            # Always report the sequence number, even with no text, so the GUI never waits on it
+            text_queue.put((seq, transcription))
 
 # --- Audio Input ---
+_chunk_seq = itertools.count()
+
 def audio_callback(indata, frames, time, status):
     """Captures audio and puts it into a queue."""
     if status:
         print(status, flush=True)
-    audio_queue.put(indata.copy())
+    if audio_queue.full():
+        # Drop the oldest waiting chunk rather than fall further behind
+        try:
+            dropped_seq, dropped_slot, _ = audio_queue.get_nowait()
+            free_slots.put(dropped_slot)
+            text_queue.put((dropped_seq, ""))
+        except queue.Empty:
+            pass
+    try:
+        slot = free_slots.get_nowait()
+    except queue.Empty:
+        print("Transcription is falling behind, dropping an audio chunk.", flush=True)
+        return
+    # The stream is mono float32, so the first channel is the whole signal
+    np.copyto(audio_ring[slot, :frames], indata[:, 0])
+    audio_queue.put((next(_chunk_seq), slot, frames))
 
 # --- Pygame Helper Functions ---
+_FONT_CACHE = {}  # (font name, size) -> pygame.freetype.Font
+
+def get_font(font_name, size):
+    """Returns a cached FreeType font, looking the system font up only once."""
+    key = (font_name, size)
+    font = _FONT_CACHE.get(key)
+    if font is None:
+        try:
+            if pygame.font.match_font(font_name) is None:
+                raise FileNotFoundError(font_name)
+            font = ft.SysFont(font_name, size)
+        except:
+            # pygame.font shrinks its default font to 0.6875x; do the same so sizes match
+            font = ft.Font(None, max(1, int(size * 0.6875)))
+        font.pad = True  # Size text boxes to the full line height, like pygame.font
+        _FONT_CACHE[key] = font
+    return font
+
+def get_line_height(font):
+    """Returns the font's ascent + descent, the line height pygame.font used."""
+    return font.get_sized_ascender() - font.get_sized_descender()
+
 def draw_person(surface, lightness_level):
     """Draws the person figure. lightness_level is 0.0 (black) to 1.0 (white)."""
     color_val = int(255 * lightness_level)
@@ -111,75 +215,104 @@ def draw_person(surface, lightness_level):
     # Head
     pygame.draw.circle(surface, person_color, (center_x, center_y - 50), 30)
 
-def draw_text_in_columns(surface, word_color_chunks, font):
-    """Draws text word-by-word in two columns, with colors."""
+def new_text_layout(surface):
+    """Returns the cursor state for laying text out in two columns on the surface."""
     margin = 40
     person_area_width = 250
     col_width = (surface.get_width() - person_area_width - 2 * margin) // 2
-    
-    left_col_x = margin
-    right_col_x = surface.get_width() - margin - col_width
-    
-    col_y = margin
-    current_col_x = left_col_x
-    
-    screen_full = False
-    space_width = font.size(' ')[0]
-
-    # Start with a fresh line position for the first chunk
-    current_line_x = current_col_x
-
-    for chunk in word_color_chunks:
-        for i, (word, color) in enumerate(chunk):
-            word_surface = font.render(word, True, color)
-            word_width, word_height = word_surface.get_size()
-
-            # Check for line break before drawing the word
-            if current_line_x + word_width > current_col_x + col_width:
-                col_y += word_height
-                current_line_x = current_col_x
-
-                # Check for column break
-                if col_y + word_height > surface.get_height() - margin:
-                    if current_col_x == left_col_x:
-                        current_col_x = right_col_x
-                        col_y = margin
-                        current_line_x = current_col_x
-                    else:
-                        screen_full = True
-                        break
-            
-            surface.blit(word_surface, (current_line_x, col_y))
-            current_line_x += word_width + space_width
-        
-        if screen_full:
-            break
-        
+    return {
+        "margin": margin,
+        "col_width": col_width,
+        "left_col_x": margin,
+        "right_col_x": surface.get_width() - margin - col_width,
+        "col_x": margin,   # Left edge of the current column
+        "line_x": margin,  # Where the next word goes on the current line
+        "col_y": margin,   # Top of the current line
+        "full": False,
+    }
+
+@njit(cache=True)
+def layout_words(widths, line_height, space_width, top_y, max_y,
+                 left_col_x, right_col_x, col_width, col_x, line_x, col_y):
+    """Positions one chunk of words from the cursor, then moves to a new line.
+
+    Returns (xs, ys, n_placed, col_x, line_x, col_y, full); only the first
+    n_placed words fit, and full is True once both columns are used up.
+    """
+    n = widths.shape[0]
+    xs = np.empty(n, np.int32)
+    ys = np.empty(n, np.int32)
+    n_placed = 0
+    full = False
+    for i in range(n):
+        # Check for line break before placing the word
+        if line_x + widths[i] > col_x + col_width:
+            col_y += line_height
+            line_x = col_x
+            # Check for column break
+            if col_y + line_height > max_y:
+                if col_x == left_col_x:
+                    col_x = right_col_x
+                    col_y = top_y
+                    line_x = col_x
+                else:
+                    full = True
+                    break
+        xs[i] = line_x
+        ys[i] = col_y
+        n_placed += 1
+        line_x += widths[i] + space_width
+
+    if not full:
         # After a chunk, move to the next line
-        col_y += font.get_height()
-        current_line_x = current_col_x # Reset x position for the new line
-        if col_y + font.get_height() > surface.get_height() - margin:
-            if current_col_x == left_col_x:
-                current_col_x = right_col_x
-                col_y = margin
+        col_y += line_height
+        line_x = col_x
+        if col_y + line_height > max_y:
+            if col_x == left_col_x:
+                col_x = right_col_x
+                col_y = top_y
+                line_x = col_x
             else:
-                screen_full = True
-                break
-
-    return screen_full
-
-def draw_onboarding(surface, font_name):
+                full = True
+    return xs, ys, n_placed, col_x, line_x, col_y, full
+
+def append_chunk_to_canvas(canvas, font, chunk, layout, space_width):
+    """Lays out a chunk of (word, color) pairs and renders it onto the canvas. Returns True once the page is full."""
+    if layout["full"]:
+        return True
+    widths = np.array([font.get_rect(word).width for word, _ in chunk], dtype=np.int32)
+    xs, ys, n_placed, layout["col_x"], layout["line_x"], layout["col_y"], layout["full"] = layout_words(
+        widths, get_line_height(font), space_width,
+        layout["margin"], canvas.get_height() - layout["margin"],
+        layout["left_col_x"], layout["right_col_x"], layout["col_width"],
+        layout["col_x"], layout["line_x"], layout["col_y"],
+    )
+    for i in range(n_placed):
+        word, color = chunk[i]
+        font.render_to(canvas, (int(xs[i]), int(ys[i])), word, color)
+    return layout["full"]
+
+def load_fonts(font_name):
+    """Returns every font the GUI needs, keyed by point size."""
+    return {size: get_font(font_name, size) for size in (74, 50, 36, 24)}
+
+def build_text_cache(fonts):
+    """Pre-renders the static labels so each frame only blits them."""
+    return {
+        "title": fonts[74].render("Echo Journal", TEXT_COLOR)[0],
+        "subtitle": fonts[36].render("Press any key to start", (100, 100, 100))[0],
+        "loading": fonts[50].render("Loading model, please wait...", TEXT_COLOR)[0],
+        "recording": fonts[24].render("Recording in progress", (200, 0, 0))[0],
+        "pause": fonts[24].render("Pause Recording", BUTTON_TEXT_COLOR)[0],
+        "save": fonts[24].render("Save Screenshot", BUTTON_TEXT_COLOR)[0],
+        "resume": fonts[24].render("Resume", BUTTON_TEXT_COLOR)[0],
+    }
+
+def draw_onboarding(surface, text_cache):
     """Draws the initial 'Press to Start' screen."""
     surface.fill(BACKGROUND_COLOR)
-    try:
-        title_font = pygame.font.SysFont(font_name, 74)
-        subtitle_font = pygame.font.SysFont(font_name, 36)
-    except:
-        title_font = pygame.font.Font(None, 74)
-        subtitle_font = pygame.font.Font(None, 36)
-
-    title_text = title_font.render("Echo Journal", True, TEXT_COLOR)
-    subtitle_text = subtitle_font.render("Press any key to start", True, (100, 100, 100))
+    title_text = text_cache["title"]
+    subtitle_text = text_cache["subtitle"]
     
     title_rect = title_text.get_rect(center=(surface.get_width() // 2, surface.get_height() // 2 - 50))
     subtitle_rect = subtitle_text.get_rect(center=(surface.get_width() // 2, surface.get_height() // 2 + 20))
@@ -187,21 +320,16 @@ def draw_onboarding(surface, font_name):
     surface.blit(title_text, title_rect)
     surface.blit(subtitle_text, subtitle_rect)
 
-def draw_loading(surface, font_name):
+def draw_loading(surface, text_cache):
     """Draws the 'Loading...' screen."""
     surface.fill(BACKGROUND_COLOR)
-    try:
-        loading_font = pygame.font.SysFont(font_name, 50)
-    except:
-        loading_font = pygame.font.Font(None, 50)
-    text = loading_font.render("Loading model, please wait...", True, TEXT_COLOR)
+    text = text_cache["loading"]
     text_rect = text.get_rect(center=(surface.get_width() // 2, surface.get_height() // 2))
     surface.blit(text, text_rect)
 
-def draw_button(surface, rect, text, font):
-    """Draws a button with text."""
+def draw_button(surface, rect, text_surf):
+    """Draws a button with a pre-rendered text label."""
     pygame.draw.rect(surface, BUTTON_COLOR, rect, border_radius=8)
-    text_surf = font.render(text, True, BUTTON_TEXT_COLOR)
     text_rect = text_surf.get_rect(center=rect.center)
     surface.blit(text_surf, text_rect)
 
@@ -210,46 +338,74 @@ def main():
     # Application state
     app_state = "ONBOARDING" # ONBOARDING, LOADING, RUNNING, FINISHED
     
-    # Start the transcription worker thread
-    worker = threading.Thread(target=transcription_worker, daemon=True)
-    worker.start()
-
     # Initialize Pygame
     pygame.init()
     screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
     pygame.display.set_caption("Echo Journal")
+    ft.init()
+
+    # Start the transcription worker thread (after pygame.init so it can post MODEL_READY)
+    worker = threading.Thread(target=transcription_worker, daemon=True)
+    worker.start()
 
     # --- FONT SETUP ---
     try:
         font_name = 'VCR OSD Mono'
-        pixel_font = pygame.font.SysFont(font_name, 30)
+        pixel_font = get_font(font_name, 30)
     except:
         print("VCR OSD Mono font not found. Using default monospace font.")
         font_name = 'monospace'
-        pixel_font = pygame.font.SysFont(font_name, 24)
+        pixel_font = get_font(font_name, 24)
+
+    fonts = load_fonts(font_name)
+    text_cache = build_text_cache(fonts)
 
     # --- Button Setup ---
-    button_font = pygame.font.SysFont(font_name, 24)
     stop_button_rect = pygame.Rect(WINDOW_WIDTH - 270, WINDOW_HEIGHT - 60, 250, 40)
     save_button_rect = pygame.Rect(WINDOW_WIDTH - 270, WINDOW_HEIGHT - 60, 250, 40)
     resume_button_rect = pygame.Rect(WINDOW_WIDTH - 460, WINDOW_HEIGHT - 60, 170, 40)
 
-    word_color_chunks = []
+    space_width = pixel_font.get_rect(' ').width
+    # Words are blitted once onto a persistent canvas as they arrive, never re-laid out
+    canvas = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)).convert()
+    canvas.fill(BACKGROUND_COLOR)
+    text_layout = new_text_layout(canvas)
+    screen_is_full = False
+    pending_text = {} # Transcriptions that arrived ahead of next_seq
+    next_seq = 0
     total_chars = 0
     running = True
     stream_active = False
 
+    needs_redraw = True  # Only repaint and flip when something visible changed
+
     # Main GUI loop
     while running:
-        for event in pygame.event.get():
+        # Block until an event arrives instead of busy-polling; while recording,
+        # also wake at ~60 Hz to pick up new transcriptions
+        if app_state == "RUNNING":
+            events = [pygame.event.wait(timeout=16)]
+        else:
+            events = [pygame.event.wait()]
+        events.extend(pygame.event.get())
+        start_stream = False
+        for event in events:
             if event.type == pygame.QUIT:
                 running = False
+            if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                needs_redraw = True
             if app_state == "ONBOARDING" and event.type == pygame.KEYDOWN:
                 app_state = "LOADING"
+                needs_redraw = True
+                # The model may have finished loading while the start screen was up
+                start_stream = model_loaded.is_set()
+            elif app_state == "LOADING" and event.type == MODEL_READY:
+                start_stream = True
             if event.type == pygame.MOUSEBUTTONDOWN:
                 # --- Button Click Handling ---
                 if app_state == "RUNNING" and stop_button_rect.collidepoint(event.pos):
                     app_state = "FINISHED"
+                    needs_redraw = True
                     if stream_active: stream.stop()
                     print("Recording paused by user.")
                 
@@ -262,100 +418,110 @@ def main():
                     
                     elif resume_button_rect.collidepoint(event.pos):
                         app_state = "RUNNING"
+                        needs_redraw = True
                         if stream_active: stream.start()
                         print("Recording resumed.")
-        
-        screen.fill(BACKGROUND_COLOR)
+
+        if start_stream:
+            # Model is ready, start the audio stream
+            try:
+                stream = sd.InputStream(
+                    samplerate=SAMPLE_RATE, 
+                    blocksize=BLOCK_SIZE, 
+                    channels=1, 
+                    dtype='float32',
+                    callback=audio_callback
+                )
+                stream.start()
+                stream_active = True
+                print("\n🎙️  Listening... Close the Pygame window to stop.")
+                app_state = "RUNNING"
+                needs_redraw = True
+            except Exception as e:
+                print(f"Fatal error starting audio stream: {e}")
+                running = False
+
+        if app_state == "RUNNING":
+            # Workers can finish out of order, so buffer results until the next chunk in sequence arrives
+            while True:
+                try:
+                    seq, text = text_queue.get_nowait()
+                except queue.Empty:
+                    break
+                pending_text[seq] = text
+
+            while app_state == "RUNNING" and next_seq in pending_text:
+                new_text = pending_text.pop(next_seq)
+                next_seq += 1
+                if not new_text:
+                    continue
+                total_chars += len(new_text)
+                
+                # --- Emotion Analysis ---
+                # Lowercase and strip punctuation for better matching in lexicon
+                new_chunk = []
+                for word in new_text.split():
+                    color = WORD_COLOR.get(word.lower().strip(string.punctuation), DEFAULT_TEXT_COLOR)
+                    new_chunk.append((word, color))
+                
+                # Place only the new words on the canvas and check if it is full
+                if new_chunk:
+                    screen_is_full = append_chunk_to_canvas(canvas, pixel_font, new_chunk, text_layout, space_width)
+
+                if screen_is_full:
+                    app_state = "FINISHED"
+                    if stream_active: stream.stop()
+                    print("Screen is full. Recording paused.")
+                needs_redraw = True
+
+        if not needs_redraw:
+            continue
+        needs_redraw = False
 
         # --- State Machine for Drawing ---
         if app_state == "ONBOARDING":
-            draw_onboarding(screen, font_name)
+            draw_onboarding(screen, text_cache)
         
         elif app_state == "LOADING":
-            draw_loading(screen, font_name)
-            if model_loaded.is_set():
-                # Model is ready, start the audio stream
-                try:
-                    stream = sd.InputStream(
-                        samplerate=SAMPLE_RATE, 
-                        blocksize=BLOCK_SIZE, 
-                        channels=1, 
-                        dtype='float32',
-                        callback=audio_callback
-                    )
-                    stream.start()
-                    stream_active = True
-                    print("\n🎙️  Listening... Close the Pygame window to stop.")
-                    app_state = "RUNNING"
-                except Exception as e:
-                    print(f"Fatal error starting audio stream: {e}")
-                    running = False
+            draw_loading(screen, text_cache)
         
         if app_state in ["RUNNING", "FINISHED"]:
-            if app_state == "RUNNING":
-                try:
-                    new_text = text_queue.get_nowait()
-                    total_chars += len(new_text)
-                    
-                    # --- Emotion Analysis ---
-                    emotion_analysis = NRCLex(new_text)
-                    words = new_text.split()
-                    new_chunk = []
-                    for word in words:
-                        # Find the most prominent emotion for the word
-                        # Make word lowercase for better matching in lexicon
-                        affect_list = emotion_analysis.affect_dict.get(word.lower(), [])
-                        color = DEFAULT_TEXT_COLOR
-                        if affect_list:
-                            # Prioritize specific emotions over general positive/negative
-                            primary_emotion = affect_list[0]
-                            if primary_emotion in EMOTION_COLORS:
-                                color = EMOTION_COLORS[primary_emotion]
-                        new_chunk.append((word, color))
-                    
-                    if new_chunk:
-                        word_color_chunks.append(new_chunk)
-
-                except queue.Empty:
-                    pass
-
             # --- Drawing ---
+            # The canvas already holds every word drawn so far
+            screen.blit(canvas, (0, 0))
+
             # Calculate lightness level (0.0 is black, 1.0 is white)
             lightness_level = min(1.0, total_chars / TARGET_CHARS_FOR_RELEASE)
             draw_person(screen, lightness_level)
 
-            # Draw text and check if screen is full
-            screen_is_full = draw_text_in_columns(screen, word_color_chunks, pixel_font)
-
-            if screen_is_full and app_state == "RUNNING":
-                app_state = "FINISHED"
-                if stream_active: stream.stop()
-                print("Screen is full. Recording paused.")
-
             # Draw UI elements based on state
             if app_state == "RUNNING":
                 # Draw "Recording in progress" indicator
-                rec_font = pygame.font.SysFont(font_name, 24)
-                rec_text = rec_font.render("Recording in progress", True, (200, 0, 0))
-                screen.blit(rec_text, (20, WINDOW_HEIGHT - 40))
+                screen.blit(text_cache["recording"], (20, WINDOW_HEIGHT - 40))
                 # Draw Pause Button
-                draw_button(screen, stop_button_rect, "Pause Recording", button_font)
+                draw_button(screen, stop_button_rect, text_cache["pause"])
             
             elif app_state == "FINISHED":
                 # Draw Save Screenshot and Resume Buttons
-                draw_button(screen, save_button_rect, "Save Screenshot", button_font)
+                draw_button(screen, save_button_rect, text_cache["save"])
                 if not screen_is_full:
-                    draw_button(screen, resume_button_rect, "Resume", button_font)
+                    draw_button(screen, resume_button_rect, text_cache["resume"])
 
         pygame.display.flip()
-        pygame.time.wait(10)
 
     # --- Cleanup ---
     print("\n🛑 Stopping...")
     if 'stream' in locals() and stream_active:
         stream.stop()
         stream.close()
-    audio_queue.put(None)
+    # Clear out unprocessed chunks so there is room for one sentinel per worker
+    while not audio_queue.empty():
+        try:
+            audio_queue.get_nowait()
+        except queue.Empty:
+            break
+    for _ in range(N_WORKERS):
+        audio_queue.put(None)
     worker.join()
     pygame.quit()
 
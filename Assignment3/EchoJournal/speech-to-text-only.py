@@ -32,32 +32,60 @@ BLOCK_SIZE = int(SAMPLE_RATE * CHUNK_SECONDS)
 
 # --- Global Queue for Audio Chunks ---
 audio_queue = queue.Queue()
+model_loaded = threading.Event() # Set once the model is ready to transcribe
+
+# --- Preallocated Ring Buffer for Audio Chunks ---
+# The callback copies each block into a free row and queues its index; the worker
+# hands the row back once transcribed, so no array is allocated per chunk.
+N_AUDIO_SLOTS = 4
+audio_ring = np.empty((N_AUDIO_SLOTS, BLOCK_SIZE), dtype=np.float32)
+free_slots = queue.Queue()
+for _slot in range(N_AUDIO_SLOTS):
+    free_slots.put(_slot)
 
 def audio_callback(indata, frames, time, status):
     """This is called (from a separate thread) for each audio block."""
     if status:
         print(status, flush=True)
-    audio_queue.put(indata.copy())
+    try:
+        slot = free_slots.get_nowait()
+    except queue.Empty:
+        print("Transcription is falling behind, dropping an audio chunk.", flush=True)
+        return
+    # The stream is mono float32, so the first channel is the whole signal
+    np.copyto(audio_ring[slot, :frames], indata[:, 0])
+    audio_queue.put((slot, frames))
 
 def transcription_worker():
     """A worker thread that transcribes audio from the queue."""
     print(f"Loading Whisper model '{MODEL_SIZE}' on device '{DEVICE}'...")
-    # Use float16 for GPU, float32 for CPU
-    compute_type = "float16" if DEVICE == "cuda" else "float32"
+    # Use float16 for GPU, int8 for CPU (CTranslate2 quantizes the float weights when loading)
+    compute_type = "float16" if DEVICE == "cuda" else "int8"
     model = WhisperModel(MODEL_SIZE, device=DEVICE, compute_type=compute_type)
     print("Model loaded. Transcription is active.")
+    model_loaded.set()
     
     while True:
         try:
             audio_chunk = audio_queue.get(timeout=1)
             
-            # Convert to a flat float32 array
-            audio_np = np.squeeze(audio_chunk).astype(np.float32)
-            
-            # Transcribe the audio chunk
-            segments, _ = model.transcribe(audio_np, language="en", beam_size=5)
+            # View into the preallocated ring buffer, no copy or conversion needed
+            slot, frames = audio_chunk
+            audio_np = audio_ring[slot, :frames]
             
-            transcription = "".join(segment.text for segment in segments).strip()
+            try:
+                # Transcribe the audio chunk
+                segments, _ = model.transcribe(
+                    audio_np, language="en",
+                    beam_size=1,  # Greedy decoding: several times faster than beam search for short chunks
+                    vad_filter=True,  # Skip silent stretches instead of decoding them
+                    condition_on_previous_text=False,
+                )
+                
+                # Segments are decoded lazily, so the slot is only free after this join
+                transcription = "".join(segment.text for segment in segments).strip()
+            finally:
+                free_slots.put(slot)
             if transcription:
                 print(f"🗣️ {transcription}")
 
@@ -79,6 +107,10 @@ def main():
 
     # Start the audio stream from the microphone
     try:
+        # Wait for the model first, so no audio is captured (and dropped) while it loads or downloads
+        while not model_loaded.wait(timeout=0.5):
+            if not worker.is_alive():
+                return
         with sd.InputStream(samplerate=SAMPLE_RATE, 
                              blocksize=BLOCK_SIZE, 
                              device=None, # Default input device
@@ -1,6 +1,7 @@
 from bokeh.plotting import figure, show, output_file
 from bokeh.models import ColumnDataSource, HoverTool
 import pandas as pd
+import numpy as np
 
 print("Script started")
 
@@ -18,14 +19,18 @@ def load_data(path):
 
 datetime, tide_level = load_data(csv_path)
 
-# Map y values to blue intensity (0-255)
-min_tide, max_tide = min(tide_level), max(tide_level)
-blue_intensity = [int(255 * (val - min_tide) / (max_tide - min_tide)) if max_tide > min_tide else 128 for val in tide_level]
-colors = [f"rgb(0,0,{b})" for b in blue_intensity]
+# Map y values to blue intensity (0-255), vectorized with NumPy
+levels = tide_level.to_numpy(dtype=np.float64)
+min_tide, max_tide = levels.min(), levels.max()
+if max_tide > min_tide:
+    blue_intensity = (255 * (levels - min_tide) / (max_tide - min_tide)).astype(np.uint8)
+else:
+    blue_intensity = np.full(levels.shape, 128, dtype=np.uint8)
+colors = np.char.add(np.char.add('rgb(0,0,', blue_intensity.astype(str)), ')')
 
 source = ColumnDataSource(data=dict(
-    datetime=list(datetime),
-    tide_level=list(tide_level),
+    datetime=datetime.to_numpy(),
+    tide_level=levels,
     color=colors
 ))
 
@@ -34,7 +39,8 @@ p = figure(
     x_axis_label='datetime',
     y_axis_label='tide_level',
     tools="pan,wheel_zoom,box_zoom,reset",
-    x_axis_type='datetime'
+    x_axis_type='datetime',
+    output_backend="webgl"
 )
 p.circle('datetime', 'tide_level', color='color', size=10, source=source)
 
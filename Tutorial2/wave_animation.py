@@ -1,10 +1,12 @@
 import pygame
+from pygame._sdl2.video import Window, Renderer, Texture
 import pandas as pd
+import numpy as np
 import sys
 
 # Load tide data from CSV
 data = pd.read_csv('tides_processed.csv')
-tide_levels = data['tide_level'].astype(float).tolist()
+tide_levels = data['tide_level'].to_numpy(dtype=np.float32)
 
 # Pygame setup
 WIDTH, HEIGHT = 800, 400
@@ -14,18 +16,28 @@ BG_COLOR = (30, 30, 30)
 POINT_RADIUS = 2
 
 pygame.init()
-screen = pygame.display.set_mode((WIDTH, HEIGHT))
-pygame.display.set_caption('Tide Level Wave Animation')
+# Hardware renderer: each frame is a single GPU copy out of a pre-rendered wave texture
+window = Window('Tide Level Wave Animation', size=(WIDTH, HEIGHT))
+renderer = Renderer(window, vsync=False)
 clock = pygame.time.Clock()
 
-# Scale tide levels to fit the screen vertically
-tide_min, tide_max = min(tide_levels), max(tide_levels)
-def scale_y(val):
-    return HEIGHT - int((val - tide_min) / (tide_max - tide_min) * (HEIGHT - 40))
+# Scale tide levels to fit the screen vertically, once; frames only index into this
+tide_min, tide_max = tide_levels.min(), tide_levels.max()
+scaled_y = HEIGHT - ((tide_levels - tide_min) / (tide_max - tide_min) * (HEIGHT - 40)).astype(np.int32)
 
 # Animation variables
 wave_length = min(len(tide_levels), WIDTH)
 start_idx = 0
+
+# Draw the whole wave once, followed by its first wave_length points again so the
+# view can wrap around; every frame is then just a window into this strip
+strip_length = scaled_y.size + wave_length
+strip_xs = np.arange(strip_length)
+strip_points = np.column_stack((strip_xs, scaled_y[strip_xs % scaled_y.size])).tolist()
+strip = pygame.Surface((strip_length, HEIGHT))
+strip.fill(BG_COLOR)
+pygame.draw.lines(strip, WAVE_COLOR, False, strip_points, 2 * POINT_RADIUS)
+wave_texture = Texture.from_surface(renderer, strip)
 import random
 speed = random.randint(1, 100)  # random speed between 1 and 100
 print(f"Wave speed: {speed} pixels/frame")
@@ -36,21 +48,13 @@ while running:
         if event.type == pygame.QUIT:
             running = False
 
-    screen.fill(BG_COLOR)
-
-    # Draw the wave
-    points = []
-    for i in range(wave_length):
-        x = i
-        idx = (start_idx + i) % len(tide_levels)
-        y = scale_y(tide_levels[idx])
-        points.append((x, y))
-    if len(points) > 1:
-        pygame.draw.lines(screen, WAVE_COLOR, False, points, 2)
-    for pt in points:
-        pygame.draw.circle(screen, WAVE_COLOR, pt, POINT_RADIUS)
-
-    pygame.display.flip()
+    renderer.draw_color = (*BG_COLOR, 255)
+    renderer.clear()
+
+    # Draw the wave by scrolling the source rectangle along the pre-rendered strip
+    wave_texture.draw(srcrect=(start_idx, 0, wave_length, HEIGHT), dstrect=(0, 0, wave_length, HEIGHT))
+
+    renderer.present()
     clock.tick(FPS)
     start_idx = (start_idx + speed) % len(tide_levels)
 